@@ -4,154 +4,492 @@ import json
 import re
 import datetime
 import time
+import random
+import hashlib
+import tempfile
+import asyncio
+import argparse
+import textwrap
+import mmap
+from functools import lru_cache
+import aiohttp
+import orjson
+from rapidfuzz import fuzz
+# Python < 3.12에서는 pydantic(response_schema 변환)이 typing.TypedDict를 거부함
+from typing_extensions import TypedDict
 from google import generativeai as genai
-import requests
 from google.api_core import exceptions
 
 # 설정
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
 BRAVE_API_KEY = os.environ.get("BRAVE_API_KEY")
-REPO_PATH = "index.html"
+KST = datetime.timezone(datetime.timedelta(hours=9))  # 한국 시간 (UTC+9)
+NEWS_DATA_PATH = "news_data.json"
+LLM_CACHE_PATH = os.path.join("data", "llm_cache.json")
+LLM_CACHE_MAX_AGE_DAYS = 14  # 이보다 오래된 캐시 항목은 저장 시 삭제
+BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
+BRAVE_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+    "X-Subscription-Token": BRAVE_API_KEY or ""
+}
+BRAVE_MIN_INTERVAL = 1.0  # Brave 무료 플랜: 초당 1회 요청 제한
+BRAVE_MAX_RETRIES = 2
+BRAVE_BACKOFF_FACTOR = 0.5
+BRAVE_RETRY_STATUSES = {429, 500, 502, 503, 504}
+NEWS_QUERY_TEMPLATE = "보험 업계 신규 정책 뉴스 {date}"
+BROAD_NEWS_QUERY = "보험 업계 최신 핵심 뉴스 브리핑"
+MIN_NEWS_RESULTS = 3  # 날짜 검색 결과가 이보다 적으면 포괄 검색 결과 사용 (backfill은 해당 날짜 건너뜀)
+BACKFILL_BATCH_SIZE = 3  # Gemini 한 번에 생성할 날짜 수 (출력 토큰 한도 초과 방지)
+DUPLICATE_TITLE_RATIO = 90  # 제목 유사도가 이 값 이상이면 같은 기사로 간주 (0~100)
+RATE_LIMIT_RETRIES = 4  # 한도 초과 시 같은 모델로 호출하는 최대 횟수 (대기: 1, 2, 4초)
 
+# 2026-02-20 Update: Removed non-existent models and added rate limit handling
+GEMINI_MODELS = [
+    "gemini-2.0-flash",     # 최신 & 빠름 (가장 안정적)
+    "gemini-1.5-pro",       # 고성능
+    "gemini-1.5-flash",     # 가성비
+]
+
+class NewsItem(TypedDict):
+    category: str
+    icon: str
+    title: str
+    details: list[str]
+    insight: str
+    link: str
+
+# JSON 모드 + 스키마 지정으로 응답을 NewsItem 배열 형태로 유도
+# 클래스로 만든 스키마는 required가 빠져 모든 필드가 선택 사항이 되므로 필드 검사는 _valid_news_items에서 따로 함
+NEWS_GENERATION_CONFIG = genai.types.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=list[NewsItem]
+)
+
+class DailyBriefing(TypedDict):
+    date: str
+    items: list[NewsItem]
+
+# 여러 날짜를 한 번에 생성할 때 사용 (스키마가 임의 키의 dict를 지원하지 않아 날짜를 필드로 둠)
+BACKFILL_GENERATION_CONFIG = genai.types.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=list[DailyBriefing]
+)
+
+_NEWS_ITEM_FORMAT = textwrap.dedent("""
+    {
+     "category": "영문 카테고리 (예: NEW POLICY, MARKET TREND, AI TECH, REGULATION, NEW PRODUCT)",
+     "icon": "Lucide 아이콘 이름 (예: activity, trending-up, bot, shield-alert, brain)",
+     "title": "기사의 핵심을 찌르는 임팩트 있는 제목 (한국어)",
+     "details": ["내용 요약 1", "내용 요약 2", "내용 요약 3"],
+     "insight": "전문가로서의 통찰력이 담긴 한 줄 평 (대표님께 조언하는 스타일)",
+     "link": "기사 원문 URL (검색 결과의 u 값)"
+    }
+""").strip()
+
+# 입력 토큰 절감을 위해 들여쓰기 없는 템플릿을 모듈 로드 시 한 번만 생성
+_PROMPT_TEMPLATE = textwrap.dedent("""
+    아래는 오늘 날짜({date})의 보험 관련 뉴스 검색 결과이다. (t: 제목, d: 요약, u: URL)
+    이 내용들을 바탕으로 '안프로의 보험 핵심 뉴스 브리핑'에 들어갈 5개의 핵심 뉴스 항목을 JSON 배열 형태로 생성해줘.
+    각 뉴스 항목은 다음 형식을 따라야 해:
+    {item_format}
+    검색 결과:
+    {results}
+    응답은 반드시 순수 JSON 배열이어야 하며, 다른 설명은 포함하지 마.
+""").strip()
+
+_BACKFILL_PROMPT_TEMPLATE = textwrap.dedent("""
+    아래는 날짜별 보험 관련 뉴스 검색 결과이다. (t: 제목, d: 요약, u: URL)
+    각 날짜마다 해당 날짜의 검색 결과만을 바탕으로 '안프로의 보험 핵심 뉴스 브리핑'에 들어갈 5개의 핵심 뉴스 항목을 생성해줘.
+    결과는 {{"date": "YYYY-MM-DD", "items": [뉴스 항목 5개]}} 객체의 JSON 배열로, 입력의 모든 날짜를 포함해야 해.
+    각 뉴스 항목은 다음 형식을 따라야 해:
+    {item_format}
+    날짜별 검색 결과:
+    {results}
+    응답은 반드시 순수 JSON 배열이어야 하며, 다른 설명은 포함하지 마.
+""").strip()
+
+# Gemini 설정은 한 번만 하고, 모델 객체는 이름별로 재사용
+if GEMINI_API_KEY:
+    genai.configure(api_key=GEMINI_API_KEY)
+_MODEL_CACHE = {}
+
+def get_model(model_name):
+    if model_name not in _MODEL_CACHE:
+        _MODEL_CACHE[model_name] = genai.GenerativeModel(model_name)
+    return _MODEL_CACHE[model_name]
+
+def generate_with_backoff(model, prompt, **kwargs):
+    # 한도 초과(429) 시 2^n초(1, 2, 4초) + 지터 대기 후 같은 모델로 재시도
+    for attempt in range(RATE_LIMIT_RETRIES):
+        try:
+            return model.generate_content(prompt, **kwargs)
+        except exceptions.ResourceExhausted:
+            if attempt == RATE_LIMIT_RETRIES - 1:
+                raise
+            wait = 2 ** attempt + random.random()
+            print(f"Rate limit exceeded. Retrying in {wait:.1f}s ({attempt + 1}/{RATE_LIMIT_RETRIES - 1})...", flush=True)
+            time.sleep(wait)
+
+@lru_cache(maxsize=1)
 def get_current_date():
     # 한국 시간 기준 (UTC+9)
-    now = datetime.datetime.utcnow() + datetime.timedelta(hours=9)
+    # 실행 중 자정을 넘겨도 모든 호출이 같은 날짜를 쓰도록 프로세스당 한 번만 계산
+    now = datetime.datetime.now(KST)
     return now.strftime("%Y-%m-%d")
 
+async def _wait_rate_limit(rate_limit):
+    # 요청 "시작" 시점만 1초 간격으로 띄우고, 응답 대기는 병렬로 진행
+    async with rate_limit["lock"]:
+        wait = rate_limit["last"] + BRAVE_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        rate_limit["last"] = time.monotonic()
+
+async def _search(session, query, rate_limit):
+    params = {"q": query, "count": 10}
+    for attempt in range(BRAVE_MAX_RETRIES + 1):
+        if attempt:
+            # 0.5초, 1초... 대기 후 재시도 (urllib3 Retry의 backoff_factor와 같은 방식)
+            await asyncio.sleep(BRAVE_BACKOFF_FACTOR * 2 ** (attempt - 1))
+        await _wait_rate_limit(rate_limit)
+        try:
+            async with session.get(BRAVE_SEARCH_URL, params=params) as response:
+                if response.status in BRAVE_RETRY_STATUSES and attempt < BRAVE_MAX_RETRIES:
+                    print(f"Search '{query}' returned status {response.status}. Retrying...", flush=True)
+                    continue
+                if response.status != 200:
+                    print(f"Search '{query}' returned status {response.status}.", flush=True)
+                    return []
+                data = await response.json()
+                return data.get("web", {}).get("results", [])
+        except aiohttp.ClientConnectionError as e:
+            if attempt == BRAVE_MAX_RETRIES:
+                raise
+            print(f"Search '{query}' connection failed: {e}. Retrying...", flush=True)
+
+async def _fetch_all(queries):
+    rate_limit = {"lock": asyncio.Semaphore(1), "last": float("-inf")}
+    timeout = aiohttp.ClientTimeout(total=10)
+    # 세션 하나로 모든 검색을 보내 keep-alive 연결(TCP+TLS)을 재사용
+    connector = aiohttp.TCPConnector(limit=4, limit_per_host=4)
+    async with aiohttp.ClientSession(headers=BRAVE_HEADERS, timeout=timeout, connector=connector) as session:
+        return await asyncio.gather(
+            *(_search(session, q, rate_limit) for q in queries),
+            return_exceptions=True
+        )
+
+def _select_results(date_str, results, broad_results):
+    if isinstance(results, Exception):
+        print(f"Initial search for {date_str} failed: {results}", flush=True)
+        results = []
+    else:
+        print(f"Initial search for {date_str} found {len(results)} items.", flush=True)
+
+    # 만약 검색 결과가 너무 적으면, 좀 더 포괄적인 검색 결과 사용
+    if len(results) < MIN_NEWS_RESULTS and not isinstance(broad_results, Exception):
+        print(f"Few results found. Using broader search ({len(broad_results)} items).", flush=True)
+        return broad_results
+    return results
+
 def fetch_insurance_news():
     print("Fetching insurance news...", flush=True)
-    url = "https://api.search.brave.com/res/v1/web/search"
     today = get_current_date()
-    query = f"보험 업계 신규 정책 뉴스 {today}"
-    headers = {
-        "Accept": "application/json",
-        "Accept-Encoding": "gzip",
-        "X-Subscription-Token": BRAVE_API_KEY
-    }
-    params = {"q": query, "count": 10}
-    
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        results = []
-        if response.status_code == 200:
-            results = response.json().get("web", {}).get("results", [])
-            print(f"Initial search for {today} found {len(results)} items.", flush=True)
-        
-        # 만약 검색 결과가 너무 적으면, 좀 더 포괄적으로 검색 시도
-        if len(results) < 3:
-            print("Few results found. Trying a broader search...", flush=True)
-            params["q"] = "보험 업계 최신 핵심 뉴스 브리핑"
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            if response.status_code == 200:
-                results = response.json().get("web", {}).get("results", [])
-                print(f"Broader search found {len(results)} items.", flush=True)
-
-        return results
-    except Exception as e:
-        print(f"Brave Search Request Failed: {e}", flush=True)
+    query = NEWS_QUERY_TEMPLATE.format(date=today)
+    # 결과가 적을 때 쓰던 포괄 검색을 처음부터 함께 요청 (대기 시간 t1+t2 -> max)
+    results, broad_results = asyncio.run(_fetch_all([query, BROAD_NEWS_QUERY]))
+    if isinstance(results, Exception) and isinstance(broad_results, Exception):
+        print(f"Brave Search Request Failed: {results}", flush=True)
         sys.exit(1)  # Force fail on API error
         return []
 
+    return _select_results(today, results, broad_results)
+
+def fetch_news_for_dates(dates):
+    # 날짜별 검색을 한 세션에서 동시에 요청
+    # 포괄 검색은 날짜와 무관한 "최신" 뉴스라 과거 날짜에 쓰면 오늘 기사가 섞이므로 사용하지 않음
+    print(f"Fetching insurance news for {len(dates)} dates...", flush=True)
+    queries = [NEWS_QUERY_TEMPLATE.format(date=d) for d in dates]
+    dated_results = asyncio.run(_fetch_all(queries))
+    errors = [r for r in dated_results if isinstance(r, Exception)]
+    if len(errors) == len(dated_results):
+        print(f"Brave Search Request Failed: {errors[0]}", flush=True)
+        sys.exit(1)  # Force fail on API error
+
+    results_by_date = {}
+    for date_str, results in zip(dates, dated_results):
+        if isinstance(results, Exception):
+            print(f"Search for {date_str} failed: {results}", flush=True)
+            continue
+        print(f"Search for {date_str} found {len(results)} items.", flush=True)
+        results_by_date[date_str] = results
+    return results_by_date
+
+def dedupe_news_results(news_results):
+    # 통신사 기사 재배포 등으로 거의 같은 기사가 여러 개 오므로 제목 유사도로 중복 제거
+    # 프롬프트 토큰을 줄이기 위해 title/description/url 외 필드(썸네일, meta_url 등)는 버림
+    kept = []
+    kept_titles = []
+    for r in news_results:
+        normalized = re.sub(r'\W+', '', r.get("title", "")).lower()
+        if normalized and any(fuzz.ratio(normalized, t) >= DUPLICATE_TITLE_RATIO for t in kept_titles):
+            continue
+        kept_titles.append(normalized)
+        kept.append({
+            "title": r.get("title", ""),
+            "description": r.get("description", ""),
+            "url": r.get("url", ""),
+        })
+    if len(kept) < len(news_results):
+        print(f"Removed {len(news_results) - len(kept)} duplicate results.", flush=True)
+    return kept
+
+def get_cache_key(news_results):
+    # 검색 결과의 URL 집합이 같으면 같은 키 (순서 무관)
+    urls = sorted(r.get("url", "") for r in news_results)
+    return hashlib.sha256(json.dumps(urls).encode()).hexdigest()
+
+def load_llm_cache():
+    try:
+        with open(LLM_CACHE_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+def save_llm_cache(cache):
+    # 오래된 항목을 정리해 매일 커밋되는 캐시 파일이 계속 커지지 않게 함
+    cutoff = time.time() - LLM_CACHE_MAX_AGE_DAYS * 24 * 60 * 60
+    cache = {k: v for k, v in cache.items() if v.get("ts", 0) >= cutoff}
+
+    # 임시 파일에 쓴 뒤 os.replace로 교체 (중간에 실패해도 기존 캐시 보존)
+    # 줄 단위 git diff가 되도록 들여쓰기해서 저장
+    cache_dir = os.path.dirname(LLM_CACHE_PATH)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, LLM_CACHE_PATH)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
 def generate_news_entry(news_results):
-    print("Generating news entry using Gemini...", flush=True)
-    genai.configure(api_key=GEMINI_API_KEY)
-    
-    # 2026-02-20 Update: Removed non-existent models and added rate limit handling
-    models_to_try = [
-        "gemini-2.0-flash",     # 최신 & 빠름 (가장 안정적)
-        "gemini-1.5-pro",       # 고성능
-        "gemini-1.5-flash",     # 가성비
+    news_results = dedupe_news_results(news_results)
+    cache = load_llm_cache()
+    cache_key = get_cache_key(news_results)
+    cached = cache.get(cache_key)
+    if cached:
+        print("Same search results found in LLM cache. Skipping Gemini call.", flush=True)
+        return cached["entry"]
+
+    entry = _generate_news_entry(news_results)
+    if entry:
+        cache[cache_key] = {"entry": entry, "ts": time.time()}
+        try:
+            save_llm_cache(cache)
+        except OSError as e:
+            print(f"Failed to write LLM cache: {e}", flush=True)
+    return entry
+
+def _compact_results(news_results):
+    # 프롬프트에서 가장 큰 부분이 검색 결과이므로 한 글자 키로 줄여서 전달
+    return [{"t": r["title"], "d": r["description"], "u": r["url"]} for r in news_results]
+
+def _valid_news_items(items):
+    # index.html이 모든 필드(details는 배열)를 사용하므로 빠진 항목은 버림
+    if not isinstance(items, list):
+        return []
+    valid = [
+        item for item in items
+        if isinstance(item, dict)
+        and all(isinstance(item.get(key), str) for key in NewsItem.__annotations__ if key != "details")
+        and isinstance(item.get("details"), list)
     ]
+    if len(valid) < len(items):
+        print(f"Dropped {len(items) - len(valid)} news items with missing fields.", flush=True)
+    return valid
+
+def _valid_briefings(briefings):
+    # {date: items} 로 변환. date/items가 빠진 객체는 버려서 해당 날짜가 failed로 처리되게 함
+    if not isinstance(briefings, list):
+        return {}
+    entries = {}
+    for b in briefings:
+        if not isinstance(b, dict) or not isinstance(b.get("date"), str):
+            continue
+        items = _valid_news_items(b.get("items"))
+        if items:
+            entries[b["date"]] = items
+    return entries
+
+def _generate_with_fallback(prompt, generation_config, parse):
+    # parse: JSON 응답을 검사/정리하는 함수. 빈 값을 돌려주면 실패로 보고 다음 모델을 시도
     model = None
-    response = None
+    result = None
 
-    for model_name in models_to_try:
+    for model_name in GEMINI_MODELS:
         try:
             print(f"Trying Gemini model: {model_name}...", flush=True)
-            model = genai.GenerativeModel(model_name)
-            
-            prompt = f"""
-            아래는 오늘 날짜({get_current_date()})의 보험 관련 뉴스 검색 결과이다.
-            이 내용들을 바탕으로 '안프로의 보험 핵심 뉴스 브리핑'에 들어갈 5개의 핵심 뉴스 항목을 JSON 배열 형태로 생성해줘.
-            
-            각 뉴스 항목은 다음 형식을 따라야 해:
-            {{
-                "category": "영문 카테고리 (예: NEW POLICY, MARKET TREND, AI TECH, REGULATION, NEW PRODUCT)",
-                "icon": "Lucide 아이콘 이름 (예: activity, trending-up, bot, shield-alert, brain)",
-                "title": "기사의 핵심을 찌르는 임팩트 있는 제목 (한국어)",
-                "details": ["내용 요약 1", "내용 요약 2", "내용 요약 3"],
-                "insight": "전문가로서의 통찰력이 담긴 한 줄 평 (대표님께 조언하는 스타일)",
-                "link": "기사 원문 URL"
-            }}
-
-            검색 결과:
-            {json.dumps(news_results, ensure_ascii=False)}
-
-            응답은 반드시 순수 JSON 배열이어야 하며, 다른 설명은 포함하지 마.
-            """
-            
-            response = model.generate_content(prompt)
+            model = get_model(model_name)
+            response = generate_with_backoff(model, prompt, generation_config=generation_config)
+            # 스키마가 지정되어 있으므로 응답 본문 전체가 JSON (정규식 추출 불필요)
+            result = parse(json.loads(response.text))
+            if not result:
+                print(f"Empty or invalid response from {model_name}.", flush=True)
+                continue # Try next model
             print(f"Success with {model_name}.", flush=True)
             break # Success, exit loop
         except exceptions.ResourceExhausted:
-            print(f"Rate limit exceeded for {model_name}. Waiting 10s...", flush=True)
-            time.sleep(10)
+            print(f"Rate limit still exceeded for {model_name} after {RATE_LIMIT_RETRIES} attempts.", flush=True)
+            continue # Try next model
+        except json.JSONDecodeError as e:
+            print(f"JSON parsing failed with {model_name}: {e}", flush=True)
             continue # Try next model
         except Exception as e:
             print(f"Failed with {model_name}: {e}", flush=True)
             continue # Try next model
 
-    if not response:
+    if not result:
         print("All Gemini models failed.", flush=True)
-        sys.exit(1)
+        return None
 
     print("Gemini response received.", flush=True)
-    # JSON 문자열 추출 (마크다운 코드 블록 제거 등)
-    match = re.search(r'\[.*\]', response.text, re.DOTALL)
-    if match:
-        json_str = match.group()
+    return result
+
+def _generate_news_entry(news_results):
+    print("Generating news entry using Gemini...", flush=True)
+
+    # orjson은 비ASCII 문자를 이스케이프하지 않으므로 ensure_ascii=False와 같은 결과
+    prompt = _PROMPT_TEMPLATE.format(
+        date=get_current_date(),
+        item_format=_NEWS_ITEM_FORMAT,
+        results=orjson.dumps(_compact_results(news_results)).decode()
+    )
+    return _generate_with_fallback(prompt, NEWS_GENERATION_CONFIG, _valid_news_items)
+
+def _generate_backfill_entries(results_by_date):
+    print(f"Generating news entries for {len(results_by_date)} dates in one Gemini call...", flush=True)
+
+    dated_results = [{"date": d, "results": _compact_results(r)} for d, r in results_by_date.items()]
+    prompt = _BACKFILL_PROMPT_TEMPLATE.format(
+        item_format=_NEWS_ITEM_FORMAT,
+        results=orjson.dumps(dated_results).decode()
+    )
+    return _generate_with_fallback(prompt, BACKFILL_GENERATION_CONFIG, _valid_briefings) or {}
+
+def backfill(dates):
+    # 누락된 날짜들을 BACKFILL_BATCH_SIZE개씩 묶어 Gemini를 호출 (요청당 고정 지연/프롬프트 토큰을 분산)
+    dates = [d for d in dates if not already_updated(d)]
+    if not dates:
+        print("All requested dates already exist. Nothing to backfill.", flush=True)
+        return
+
+    results_by_date = fetch_news_for_dates(dates)
+    cache = load_llm_cache()
+    # 기록하지 못한 날짜 (검색 실패/결과 부족/생성 실패). 하나라도 있으면 exit 1
+    failed = [d for d in dates if d not in results_by_date]
+    pending = {}
+    for date_str, results in results_by_date.items():
+        results = dedupe_news_results(results)
+        if len(results) < MIN_NEWS_RESULTS:
+            print(f"Too few news results for {date_str} ({len(results)}). Skipping.", flush=True)
+            failed.append(date_str)
+            continue
+        cached = cache.get(get_cache_key(results))
+        if cached:
+            # 이후 Gemini 호출이 실패해도 남도록 캐시에서 찾은 날짜는 바로 기록
+            print(f"Same search results for {date_str} found in LLM cache.", flush=True)
+            update_index_html(cached["entry"], date_str)
+        else:
+            pending[date_str] = results
+
+    pending_dates = sorted(pending)
+    for i in range(0, len(pending_dates), BACKFILL_BATCH_SIZE):
+        batch = {d: pending[d] for d in pending_dates[i:i + BACKFILL_BATCH_SIZE]}
+        generated = _generate_backfill_entries(batch)
+        for date_str, results in batch.items():
+            if date_str not in generated:
+                print(f"Gemini response did not include {date_str}.", flush=True)
+                failed.append(date_str)
+                continue
+            update_index_html(generated[date_str], date_str)
+            cache[get_cache_key(results)] = {"entry": generated[date_str], "ts": time.time()}
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            print(f"JSON parsing failed: {e}", flush=True)
-            sys.exit(1)
-            return None
-    else:
-        print(f"JSON structure not found in Gemini response: {response.text[:100]}...", flush=True)
-        sys.exit(1) # Fail if JSON parsing fails
-        return None
+            save_llm_cache(cache)
+        except OSError as e:
+            print(f"Failed to write LLM cache: {e}", flush=True)
+
+    if failed:
+        print(f"Backfill failed for {len(failed)} dates: {', '.join(sorted(failed))}", flush=True)
+        sys.exit(1)
+
+def already_updated(date_str):
+    # 데이터 파일이 매일 커지므로 전체를 읽지 않고 mmap으로 '"YYYY-MM-DD":' 키만 검색
+    try:
+        with open(NEWS_DATA_PATH, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(f'"{date_str}":'.encode()) != -1
+    except FileNotFoundError:
+        return False
 
-def update_index_html(new_entry):
-    date_str = get_current_date()
-    # For testing, ensure we don't duplicate logic but file check handles it.
-    print(f"Updating index.html with news for {date_str}...", flush=True)
-    
-    with open(REPO_PATH, "r", encoding="utf-8") as f:
-        content = f.read()
+def update_index_html(new_entry, date_str=None):
+    date_str = date_str or get_current_date()
+    print(f"Updating {NEWS_DATA_PATH} with news for {date_str}...", flush=True)
+
+    # index.html은 news_data.json을 fetch()로 불러오므로 JSON 파일만 갱신하면 됨
+    try:
+        with open(NEWS_DATA_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        data = {}
 
     # 이미 해당 날짜의 데이터가 존재한다면 업데이트 하지 않음 (중복 방지)
-    if f'"{date_str}":' in content:
+    if date_str in data:
         print(f"News for {date_str} already exists. Skipping update.", flush=True)
         return
 
-    # NEWS_DATABASE 객체를 찾아 새로운 데이터 삽입
-    new_data_json = json.dumps(new_entry, ensure_ascii=False, indent=16)
-    # Insert at the beginning of the object (right after '{') or specific marker?
-    # The previous regex logic: re.sub(r'(const NEWS_DATABASE = \{)', r'\1\n            ' + insertion_text, content)
-    # This inserts it at the top, which is good.
-    
-    insertion_text = f'"{date_str}": {new_data_json},\n            '
-    
-    updated_content = re.sub(r'(const NEWS_DATABASE = \{)', r'\1\n            ' + insertion_text, content)
-
-    with open(REPO_PATH, "w", encoding="utf-8") as f:
-        f.write(updated_content)
+    # 최신 날짜가 맨 위에 오도록 날짜 역순 유지 (backfill로 과거 날짜가 들어와도 순서 유지, git diff 최소화)
+    data[date_str] = new_entry
+    data = dict(sorted(data.items(), reverse=True))
+    with open(NEWS_DATA_PATH, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+        f.write("\n")
     print("Update complete!", flush=True)
 
+def date_range(start_date, end_date):
+    # 시작일~종료일(포함)의 'YYYY-MM-DD' 목록
+    days = (end_date - start_date).days
+    return [(start_date + datetime.timedelta(days=i)).isoformat() for i in range(days + 1)]
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="안프로의 보험 핵심 뉴스 브리핑 업데이트")
+    parser.add_argument("--backfill", nargs=2, metavar=("START", "END"), type=datetime.date.fromisoformat,
+                        help="START~END(YYYY-MM-DD) 기간 중 누락된 날짜를 한 번에 생성")
+    args = parser.parse_args()
+    if args.backfill:
+        start_date, end_date = args.backfill
+        today = datetime.date.fromisoformat(get_current_date())
+        if start_date > end_date:
+            parser.error("--backfill START must not be after END.")
+        if start_date > today:
+            parser.error(f"--backfill START must not be after today ({today}).")
+        if end_date > today:
+            # 미래 날짜가 들어가면 최신 브리핑으로 표시되고, 그날의 정기 실행도 건너뛰게 됨
+            print(f"END is after today. Backfilling up to {today}.", flush=True)
+            args.backfill = [start_date, today]
+
     if not GEMINI_API_KEY or not BRAVE_API_KEY:
         print("Error: environment variables GEMINI_API_KEY or BRAVE_API_KEY not set.", flush=True)
         sys.exit(1)
+    elif args.backfill:
+        backfill(date_range(*args.backfill))
+    elif already_updated(get_current_date()):
+        # 같은 날 재실행 시 Brave/Gemini API를 호출하지 않고 바로 종료
+        print(f"News for {get_current_date()} already exists. Skipping API calls.", flush=True)
+        sys.exit(0)
     else:
         news = fetch_insurance_news()
         if news: